@@ -1,9 +1,55 @@
 from __future__ import annotations
+from collections import deque
+import functools
+import logging
+import queue
+from threading import Thread
 from typing import List
 from luma.core.virtual import terminal as luma_terminal
 from luma.lcd.device import st7789, backlit_device
 from luma.core.interface.serial import spi
-from PIL import ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+
+log = logging.getLogger(__name__)
+
+
+class FrameFlusher:
+    """Ships frames to the device from a worker thread so callers don't block on the SPI transfer"""
+    def __init__(self, device: backlit_device) -> None:
+        self._device = device
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def push(self, image) -> None:
+        while True:
+            try:
+                self._frames.put_nowait(image)
+                return
+            except queue.Full:
+                # coalesce bursts: drop the not-yet-transmitted frame for the newest one
+                try:
+                    self._frames.get_nowait()
+                    self._frames.task_done()
+                except queue.Empty:
+                    pass
+
+    def wait(self) -> None:
+        """@brief block until every queued frame reached the device"""
+        self._frames.join()
+
+    def _run(self) -> None:
+        while True:
+            image = self._frames.get()
+            try:
+                self._device.display(image)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # drop the frame but keep the worker alive: if this thread died,
+                # later frames would sit unconsumed and wait() would block forever
+                log.exception("frame transfer failed")
+            finally:
+                self._frames.task_done()
 
 
 class Terminal(luma_terminal):
@@ -12,26 +58,62 @@ class Terminal(luma_terminal):
         # if depth > 0 then don't flush (don't display on device just write to bitmap/image)
         self.context_manager_depth = 0
         self.scroll = False
+        # cursor column tracked directly so the hot paths skip the _cx division
+        self._col = 0
+        # monospace cell bitmaps keyed by (char, fg, bg) so freetype runs once per glyph
+        self._glyph_cache: dict[tuple[str, object, object], Image.Image] = {}
+        # created before super().__init__: luma's terminal constructor ends with
+        # clear(), which already goes through the overridden flush()
+        self._flusher = FrameFlusher(device)
         super().__init__(device, font, color, bgcolor, tabstop, line_height, animate, word_wrap)
 
+    def _glyph(self, char: str, fgcolor, bgcolor) -> Image.Image:
+        key = (char, fgcolor, bgcolor)
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            glyph = Image.new(self._device.mode, (self._cw, self._ch), bgcolor)
+            ImageDraw.Draw(glyph).text((0, 0), char, font=self.font, fill=fgcolor)
+            self._glyph_cache[key] = glyph
+        return glyph
+
+    def putch(self, char) -> None:
+        # non-printable characters (\r, \n, \b, \t, ...) keep luma's handling;
+        # printable non-ascii like μ or ³ renders through the glyph cache too
+        if not char.isprintable():
+            super().putch(char)
+            self._col = self._cx // self._cw
+            return
+        if self._cx + self._cw > self._device.width:
+            self.newline()
+        self._backing_image.paste(self._glyph(char, self._fgcolor, self._bgcolor), (self._cx, self._cy))
+        self._cx += self._cw
+        self._col += 1
+
     def goto(self, x: int, y: int) -> None:
         if (0 <= x < self.width) and (0 <= y < self.height):
             # pylint: disable=attribute-defined-outside-init
             self._cx = self._cw * x
             self._cy = self._ch * y
             # pylint: enable=attribute-defined-outside-init
+            self._col = x
 
     @property
     def x(self):
-        return self._cx // self._cw
+        return self._col
 
     @property
     def y(self):
         return self._cy // self._ch
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _pad(text: str, width: int) -> str:
+        return text.ljust(width)
+
     def println(self, text="", *, highlight=False, fill=True, scroll_first=False) -> None:
         if fill:
-            text = text.ljust(self.width - self.x)
+            # menu labels and sensor rows repeat, so reuse the padded string
+            text = self._pad(text, self.width - self._col)
         if scroll_first:
             self.scroll = True
             self.newline()
@@ -46,19 +128,26 @@ class Terminal(luma_terminal):
     def newline(self) -> None:
         if self.scroll or self.y + 1 < self.height:
             super().newline()
+            self._col = 0
         else:
             self.flush()
             self._cy += self._ch
 
+    def clear(self) -> None:
+        super().clear()
+        self._col = 0
+
     def flush(self) -> None:
         if self.context_manager_depth == 0:
-            super().flush()
+            # snapshot the backing image; the worker transmits it while we keep drawing
+            self._flusher.push(self._backing_image.copy())
 
     def turn_on(self) -> None:
         self._device.backlight(True)
         self._device.show()
 
     def turn_off(self) -> None:
+        self._flusher.wait()
         self._device.backlight(False)
         self._device.hide()
 
@@ -68,6 +157,10 @@ class ScreenDisplay:
         self._display = terminal
         self.rows = self._display.height
         self.cols = self._display.width
+        # shadow of what is on screen: (text, highlight) per row, None if unknown
+        # deque so scrolling evicts the top row in O(1)
+        self._shadow_rows: deque[tuple[str, bool] | None] = deque([None] * self.rows, maxlen=self.rows)
+        self._default_colors = True
 
     def __enter__(self) -> None:
         self._display.context_manager_depth += 1
@@ -76,32 +169,56 @@ class ScreenDisplay:
         self._display.context_manager_depth -= 1
         self._display.flush()
 
+    def _set_shadow_row(self, row: int, shadow: tuple[str, bool] | None) -> None:
+        if 0 <= row < self.rows:
+            # colored text renders differently, so don't treat it as known content
+            self._shadow_rows[row] = shadow if self._default_colors else None
+
     def clear(self) -> None:
         self._display.clear()
+        for row in range(self.rows):
+            self._set_shadow_row(row, ("", False))
 
     def print_lines(self, lines: List[str], *, highlight: int = -1) -> None:
-        self._display.goto(0, 0)
-        for i, line in enumerate(lines):
-            self._display.println(line, highlight=(i == highlight))
-        # clear unused part of screen
-        for _ in range(self.rows - len(lines)):
-            self._display.println()
+        with self:
+            self._print_lines(lines, highlight=highlight)
+
+    def _print_lines(self, lines: List[str], *, highlight: int) -> None:
+        for row in range(self.rows):
+            # unused part of screen is cleared with empty lines
+            text = lines[row] if row < len(lines) else ""
+            wanted = (text, row == highlight)
+            if self._shadow_rows[row] != wanted:
+                self._display.goto(0, row)
+                self._display.println(text, highlight=wanted[1])
+                self._set_shadow_row(row, wanted)
 
     def push_back(self, text: str, *, highlight: bool = False) -> None:
         self._display.goto(0, self._display.height - 1)
         self._display.println(text, highlight=highlight, scroll_first=True)
+        # shadow scrolls with the screen: top row evicted, new row appended
+        self._shadow_rows.append((text, highlight) if self._default_colors else None)
 
     def update_row(self, row: int, text: str, *, col: int = 0, highlight: bool = False, fill: bool = True) -> None:
+        full_row = col == 0 and fill
+        # skip the render and SPI transfer when the row already shows this text
+        if full_row and self._default_colors and 0 <= row < self.rows and self._shadow_rows[row] == (text, highlight):
+            return
+        # only a full-row write leaves the row in a known state
+        self._set_shadow_row(row, (text, highlight) if full_row else None)
         self._display.goto(col, row)
         self._display.println(text, highlight=highlight, fill=fill)
 
     def foreground_color(self, value) -> None:
+        self._default_colors = False
         self._display.foreground_color(value)
 
     def background_color(self, value) -> None:
+        self._default_colors = False
         self._display.background_color(value)
 
     def reset(self) -> None:
+        self._default_colors = True
         self._display.reset()
 
     def turn_on(self) -> None:
@@ -111,11 +228,37 @@ class ScreenDisplay:
         self._display.turn_off()
 
 
+class DiffST7789(st7789):
+    """st7789 that only transmits the horizontal band that changed since the
+    previous frame. The parent driver ignores luma's framebuffer machinery and
+    always addresses the full window, so the diff has to happen here: a
+    one-row update ships a ~15x smaller band instead of the whole 320x240
+    frame.
+    """
+    def __init__(self, serial_interface=None, **kwargs) -> None:
+        # set before super().__init__, which ends with clear() -> display()
+        self._prev_frame: Image.Image | None = None
+        super().__init__(serial_interface, **kwargs)
+
+    def display(self, image) -> None:
+        image = self.preprocess(image).convert("RGB")
+        previous, self._prev_frame = self._prev_frame, image
+        if previous is None:
+            top, bottom = 0, self._h
+        else:
+            changed = ImageChops.difference(image, previous).getbbox()
+            if changed is None:
+                return
+            top, bottom = changed[1], changed[3]
+        self.set_window(0, top, self._w, bottom)
+        self.data(list(image.crop((0, top, self._w, bottom)).tobytes()))
+
+
 class ST7789Display(ScreenDisplay):
     def __init__(self) -> None:
         super().__init__(
             Terminal(
-                st7789(
+                DiffST7789(
                     spi(gpio_DC=27, gpio_RST=17),
                     width=320,
                     height=240,
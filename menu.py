@@ -1,17 +1,25 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import bisect
+from itertools import islice
 import logging
 import signal
-from threading import RLock
+import subprocess
+from threading import Event, Lock, Timer
 from enum import Enum
 from datetime import datetime
-import os
-import time
 from util import ConfigManager, RepeatTimer, SensorType, SensorReadings, Key
 from display import ScreenDisplay
 
 
+# set after device teardown finished (see sensor_main.Device.close)
+SHUTDOWN_READY = Event()
+
+
 class CallableMenuElement:
+    # class-level flag so the key-press hot path avoids isinstance checks
+    is_menu = False
+
     def __init__(self, display_str: str) -> None:
         self.parent: Menu | None = None
         self.display_str = display_str
@@ -21,11 +29,21 @@ class CallableMenuElement:
 
 
 class Menu(ABC):
+    is_menu = True
+
     def __init__(self, display_str: str):
         super().__init__()
         self.parent: Menu | None = None
         self.display_str = display_str
-        self.display: ScreenDisplay
+        self._display: ScreenDisplay | None = None
+
+    @property
+    def display(self) -> ScreenDisplay:
+        """@brief display handle, resolved lazily through the parent chain"""
+        menu: Menu = self
+        while menu._display is None and menu.parent is not None:
+            menu = menu.parent
+        return menu._display
 
     @abstractmethod
     def key_press(self, key: Key) -> Menu | None:
@@ -38,8 +56,12 @@ class Menu(ABC):
     def redraw(self) -> None:
         """ redraw menu on display """
 
+    def close(self) -> Menu | None:
+        """@brief reset menu state without repainting; return parent menu"""
+        return self.parent
+
     def set_display(self, display: ScreenDisplay):
-        self.display = display
+        self._display = display
 
 
 class MenuList(Menu):
@@ -50,98 +72,103 @@ class MenuList(Menu):
             element.parent = self
         self.start_row: int = 0
         self.selected: int = 0
+        # built once: key_press dispatches with a single dict lookup
+        self._key_handlers = {
+            Key.UP: self._on_up,
+            Key.DOWN: self._on_down,
+            Key.CANCEL: self._on_cancel,
+            Key.OK: self._on_ok,
+        }
 
     def add_element(self, menu_element: Menu | CallableMenuElement) -> None:
-        if isinstance(menu_element, Menu):
-            menu_element.set_display(self.display)
+        # no display propagation: submenus resolve it lazily through parent
         menu_element.parent = self
         self.menu_elements.append(menu_element)
 
-    def set_display(self, display: ScreenDisplay) -> None:
-        """Set display recursively for every menu element"""
-        super().set_display(display)
-        for element in self.menu_elements:
-            if isinstance(element, Menu):
-                element.set_display(display)
-
     def _display_row(self, menu_index: int) -> int:
         return menu_index - self.start_row
 
     def change_highlight(self, new_highlight: int, old_highlight: int) -> None:
-        self.display.update_row(
+        update_row = self.display.update_row
+        elements = self.menu_elements
+        update_row(
             self._display_row(old_highlight),
-            self.menu_elements[old_highlight].display_str,
+            elements[old_highlight].display_str,
             highlight=False
         )
-        self.display.update_row(
+        update_row(
             self._display_row(new_highlight),
-            self.menu_elements[new_highlight].display_str,
+            elements[new_highlight].display_str,
             highlight=True
         )
 
     def key_press(self, key: Key) -> Menu | None:
-        return_menu: Menu | None = None
-        if key is Key.UP:
-            if self.selected > 0:
-                self.selected -= 1
-                if self.start_row > self.selected:
-                    self.start_row = self.selected
-                    self.redraw()
-                else:
-                    self.change_highlight(self.selected, self.selected + 1)
-            return_menu = self
-
-        if key is Key.DOWN:
-            if self.selected + 1 < len(self.menu_elements):
-                self.selected += 1
-                if self._display_row(self.selected) >= self.display.rows:
-                    self.display.update_row(
-                        self._display_row(self.selected) - 1,
-                        self.menu_elements[self.selected - 1].display_str,
-                        highlight=False
-                    )
-                    self.display.push_back(
-                        self.menu_elements[self.selected].display_str,
-                        highlight=True
-                    )
-                    self.start_row += 1
-                else:
-                    self.change_highlight(self.selected, self.selected - 1)
-            return_menu = self
-
-        if key is Key.CANCEL:
-            self.selected = 0
-            self.start_row = 0
-            return_menu = self.parent
-            if return_menu:
-                return_menu.redraw()
-
-        if key is Key.OK:
-            if self.selected < len(self.menu_elements):
-                selected_menu = self.menu_elements[self.selected]
-                if isinstance(selected_menu, Menu):
-                    selected_menu.redraw()
-                    return_menu = selected_menu
-                else:
-                    old_name = selected_menu.display_str
-                    selected_menu.call()
-                    return_menu = self
-                    if old_name != selected_menu.display_str:
-                        self.display.update_row(
-                            self._display_row(self.selected),
-                            selected_menu.display_str,
-                            highlight=True
-                        )
+        return self._key_handlers[key]()
+
+    def _on_up(self) -> Menu | None:
+        if self.selected > 0:
+            self.selected -= 1
+            if self.start_row > self.selected:
+                self.start_row = self.selected
+                self.redraw()
             else:
-                return_menu = self
-
-        return return_menu
+                self.change_highlight(self.selected, self.selected + 1)
+        return self
+
+    def _on_down(self) -> Menu | None:
+        elements = self.menu_elements
+        if self.selected + 1 < len(elements):
+            self.selected += 1
+            display = self.display
+            if self._display_row(self.selected) >= display.rows:
+                display.update_row(
+                    self._display_row(self.selected) - 1,
+                    elements[self.selected - 1].display_str,
+                    highlight=False
+                )
+                display.push_back(
+                    elements[self.selected].display_str,
+                    highlight=True
+                )
+                self.start_row += 1
+            else:
+                self.change_highlight(self.selected, self.selected - 1)
+        return self
+
+    def _on_cancel(self) -> Menu | None:
+        self.close()
+        if self.parent:
+            self.parent.redraw()
+        return self.parent
+
+    def close(self) -> Menu | None:
+        self.selected = 0
+        self.start_row = 0
+        return self.parent
+
+    def _on_ok(self) -> Menu | None:
+        if self.selected < len(self.menu_elements):
+            selected_menu = self.menu_elements[self.selected]
+            if selected_menu.is_menu:
+                selected_menu.redraw()
+                return selected_menu
+            old_name = selected_menu.display_str
+            selected_menu.call()
+            if old_name != selected_menu.display_str:
+                self.display.update_row(
+                    self._display_row(self.selected),
+                    selected_menu.display_str,
+                    highlight=True
+                )
+        return self
 
     def redraw(self) -> None:
+        # islice avoids materializing the slice before the comprehension copies it
         display_str = [
             menu.display_str
-            for menu in self.menu_elements[self.start_row : self.start_row + self.display.rows]
+            for menu in islice(self.menu_elements, self.start_row, self.start_row + self.display.rows)
         ]
+        # print_lines batches its row writes, so the frame is flushed over SPI once
         self.display.print_lines(display_str, highlight=self._display_row(self.selected))
 
 
@@ -151,38 +178,137 @@ class View(Enum):
     TEMP_PRES_HUMI = 2
 
     def next(self):
-        return View(self.value + 1 if self.value < 2 else 0)
+        return VIEW_NEXT[self]
 
     def prev(self):
-        return View(self.value - 1 if self.value > 0 else 2)
+        return VIEW_PREV[self]
+
+
+# successor/predecessor tables so view cycling is one dict lookup,
+# not a value-based constructor call
+VIEW_NEXT = {View.DATE: View.DUST, View.DUST: View.TEMP_PRES_HUMI, View.TEMP_PRES_HUMI: View.DATE}
+VIEW_PREV = {new: old for old, new in VIEW_NEXT.items()}
+
+
+# per-measurement display label, sorted color thresholds and matching colors
+DUST_THRESHOLDS = {
+    SensorType.PM1: ("PM1 =", [7, 25], ["green", "orange", "red"]),
+    SensorType.PM2_5: ("PM2.5 =", [35, 75], ["green", "orange", "red"]),
+    SensorType.PM10: ("PM10 =", [50, 110], ["green", "orange", "red"]),
+}
+TEMP_UNITS = [' °C', '%', ' hPa']
+# fixed english abbreviations: strftime would re-run locale formatting every minute
+DAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_ABBR = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
 
 class Interface:
+    # how long sensor updates are coalesced before the view is redrawn
+    REDRAW_DELAY = 0.05
+    # display-config values cached per key so redraws don't stat/parse the INI;
+    # parsed once - redraws see plain bools/ints, not strings.
+    # menu elements invalidate a key after writing it (OnOffConfig, FreqencyChoice)
+    _display_config_cache: dict[str, str | None] = {}
+    _enabled_cache: dict[str, bool] = {}
+    _view_period_cache: int | None = None
+    # filtered measurement lists per view, rebuilt after a config edit
+    _show_cache: dict[View, list] = {}
+
+    @classmethod
+    def invalidate_config(cls, key: str) -> None:
+        cls._display_config_cache.pop(key, None)
+        cls._enabled_cache.pop(key, None)
+        cls._show_cache.clear()
+        if key == "view_period":
+            cls._view_period_cache = None
+
+    @classmethod
+    def _get_display_config(cls, key: str) -> str | None:
+        if key not in cls._display_config_cache:
+            cls._display_config_cache[key] = ConfigManager.get_config_value(key, display_config=True)
+        return cls._display_config_cache[key]
+
+    @classmethod
+    def _get_view_period(cls) -> int:
+        if cls._view_period_cache is None:
+            value = cls._get_display_config("view_period")
+            cls._view_period_cache = int(value) if value else 3
+        return cls._view_period_cache
+
+    def _is_enabled(self, name: str) -> bool:
+        enabled = self._enabled_cache.get(name)
+        if enabled is None:
+            value = self._get_display_config(name)
+            # missing keys default to enabled, same as OnOffConfig
+            enabled = True if value is None else bool(int(value))
+            self._enabled_cache[name] = enabled
+        return enabled
+
     def __init__(self, *, menu: Menu, sensor_readings: SensorReadings, display: ScreenDisplay) -> None:
         self._root_menu = menu
         self._current_menu: Menu | None = None
         self._display = display
-        self._lock = RLock()
+        # plain Lock: internal helpers assume it is held instead of re-entering
+        self._lock = Lock()
         self._root_menu.set_display(display)
         self._readings = sensor_readings
+        # sensor updates waiting for the coalescing redraw timer to fire
+        self._pending_updates: set[SensorType] = set()
+        # last value seen per sensor; equal readings don't trigger a redraw
+        self._last_values: dict[SensorType, int | float | None] = {}
+        self._pending_lock = Lock()
+        self._redraw_timer: Timer | None = None
+        self._closed = False
+        # view painted last; clear() only happens when it changes
+        self._last_view: View | None = None
+        # date strings rendered at most once per displayed minute
+        self._date_key: tuple[int, int, int, int, int] | None = None
+        self._date_strs: tuple[str, str] = ("", "")
         self.view = View.DATE
         self.dust_view = [SensorType.PM1, SensorType.PM2_5, SensorType.PM10]
         self.temp_view = [SensorType.TEMPERATURE, SensorType.HUMIDITY, SensorType.PRESSURE]
-        view_period: int | str | None = ConfigManager.get_config_value("view_period", display_config=True)
-        view_period = int(view_period) if view_period else 3
-        self.view_timer = RepeatTimer(view_period, self.next_view)
+        # frozensets for O(1) "is this sensor on the current view" checks
+        self._view_sensors = {
+            View.DATE: frozenset(),
+            View.DUST: frozenset(self.dust_view),
+            View.TEMP_PRES_HUMI: frozenset(self.temp_view),
+        }
+        # fixed per-row templates; only the numeric value changes between updates
+        self._temp_templates = {
+            sensor_type: f"{sensor_type.name.capitalize()} = {{}}{unit}"
+            for sensor_type, unit in zip(self.temp_view, TEMP_UNITS)
+        }
+        self._renderers = {
+            View.DATE: self._render_date,
+            View.DUST: self._render_dust,
+            View.TEMP_PRES_HUMI: self._render_temp,
+        }
+        self.view_timer = RepeatTimer(self._get_view_period(), self.next_view)
         self.view_timer.start()
         self.display_off = False
         self._display.turn_on()
         self.show_data()
 
     def next_view(self):
+        # dirty read: skip the lock while a menu is open or the screen is off;
+        # _next_view re-checks under the lock
+        if self._current_menu is not None or self.display_off:
+            return
         with self._lock:
-            if self._current_menu is None and not self.display_off:
-                self.view = self.view.next()
-                self.display_view()
+            self._next_view()
+
+    def _next_view(self):
+        """@brief switch to the next view. Call with self._lock held"""
+        if self._current_menu is None and not self.display_off:
+            self.view = self.view.next()
+            self._display_view()
 
     def close(self):
+        with self._pending_lock:
+            self._closed = True
+            if self._redraw_timer is not None:
+                self._redraw_timer.cancel()
+                self._redraw_timer = None
         self.view_timer.cancel()
         self.view_timer.join(1)
         self._display.clear()
@@ -192,109 +318,170 @@ class Interface:
         """@brief react on pressed button"""
         with self._lock, self._display:
             if long_press:
-                if key is Key.CANCEL:
+                if key == Key.CANCEL:
                     self.display_off = True
                     self._display.turn_off()
+                    # display is off: unwind without repainting each parent menu
                     while self._current_menu is not None:
-                        self._current_menu = self._current_menu.key_press(Key.CANCEL)
+                        self._current_menu = self._current_menu.close()
             elif self.display_off:
                 self.display_off = False
-                self.show_data()
+                self._show_data()
                 self._display.turn_on()
             elif self._current_menu is None:
-                if key is Key.OK:
+                if key == Key.OK:
                     self._current_menu = self._root_menu
+                    # menus paint over the view; force a clear on the next view paint
+                    self._last_view = None
                     self._current_menu.redraw()
-                elif key is Key.UP:
+                elif key == Key.UP:
                     self.view = self.view.prev()
                     self.view_timer.reset()
-                    self.display_view()
-                elif key is Key.DOWN:
+                    self._display_view()
+                elif key == Key.DOWN:
                     self.view = self.view.next()
                     self.view_timer.reset()
-                    self.display_view()
+                    self._display_view()
             else:
                 self._current_menu = self._current_menu.key_press(key)
                 if self._current_menu is None:
-                    self.show_data()
+                    self._show_data()
 
     def show_data(self):
         """@brief show sensor data"""
         with self._lock:
-            self._current_menu = None
-            self.view = View.DATE
-            self.view_timer.reset(int(ConfigManager.get_config_value("view_period", display_config=True)))
-            self.display_view()
-
-    def display_view(self):
-        def get_color(value: int | float, colors: list[tuple[int | float, str]]):
-            last_color = colors[0][1]
-            for threshold, color in colors:
-                if value < threshold:
-                    break
-                last_color = color
-            return last_color
+            self._show_data()
 
-        with self._lock, self._display:
-            self._display.clear()
-            if self.view is View.DATE:
-                hours = datetime.now().strftime("%I:%M %p")
-                day_name = datetime.today().strftime('%a')
-                day = datetime.now().day
-                month = datetime.now().strftime('%b')
-                year = datetime.now().year
-                date = f"{day_name}, {day} {month} {year}"
-                middle_row = int(self._display.rows / 2)
-
-                self._display.update_row(middle_row - 1, hours, col=int((self._display.cols - len(hours)) / 2))
-                self._display.update_row(middle_row, date, col=int((self._display.cols - len(date)) / 2), fill=False)
-                self._display.reset()
-            elif self.view is View.DUST:
-                thresholds = {
-                    SensorType.PM1: ("PM1", [(float("-inf"), "green"), (7, "orange"), (25, "red")]),
-                    SensorType.PM2_5: ("PM2.5", [(float("-inf"), "green"), (35, "orange"), (75, "red")]),
-                    SensorType.PM10: ("PM10", [(float("-inf"), "green"), (50, "orange"), (110, "red")])
-                }
+    def _show_data(self):
+        """@brief show sensor data. Call with self._lock held"""
+        self._current_menu = None
+        self.view = View.DATE
+        self.view_timer.reset(self._get_view_period())
+        self._display_view()
+
+    def _display_view(self):
+        """@brief paint the current view. Call with self._lock held"""
+        with self._display:
+            if self.view is not self._last_view:
+                # renderers pad their rows, so repainting the same view needs no clear
+                self._display.clear()
+                self._last_view = self.view
+            self._renderers[self.view]()
+
+    def _render_date(self) -> None:
+        now = datetime.now()
+        date_key = (now.year, now.month, now.day, now.hour, now.minute)
+        if date_key != self._date_key:
+            # only re-render when the visible minute changed
+            self._date_key = date_key
+            self._date_strs = (
+                f"{(now.hour - 1) % 12 + 1:02d}:{now.minute:02d} {'PM' if now.hour >= 12 else 'AM'}",
+                f"{DAY_ABBR[now.weekday()]}, {now.day} {MONTH_ABBR[now.month - 1]} {now.year}"
+            )
+        hours, date = self._date_strs
+        cols = self._display.cols
+        middle_row = int(self._display.rows / 2)
+
+        # full-row centered writes: same layout as the old col= offsets, but stale
+        # characters from a longer previous date can't survive and the row shadow
+        # can diff them
+        self._display.update_row(middle_row - 1, " " * ((cols - len(hours)) // 2) + hours)
+        self._display.update_row(middle_row, " " * ((cols - len(date)) // 2) + date)
+        self._display.reset()
+
+    def _show_list(self, view: View) -> list:
+        show = self._show_cache.get(view)
+        if show is None:
+            if view is View.DUST:
                 show = [measurement for measurement in self.dust_view
-                        if bool(int(ConfigManager.get_config_value(measurement.name, display_config=True)))]
-                if not show:
-                    self.next_view()
-                    return
-
-                for i, sensor_type in enumerate(show):
-                    value = self._readings.get(sensor_type)
-                    value_str = '---' if value is None else str(value)
-                    string = f"{thresholds[sensor_type][0]} ="
-                    row = int(((i + 1) * self._display.rows / (len(show) + 1)))
-                    self._display.update_row(row, string, col=1)
-                    if value is not None:
-                        self._display.background_color(get_color(value, thresholds[sensor_type][1]))
-                    self._display.update_row(row, f"{value_str} μg/m³", col=2 + len(string), fill=False)
-                    self._display.reset()
+                        if self._is_enabled(measurement.name)]
             else:
-                units = [' °C', '%', ' hPa']
-                show = [measurement for measurement in zip(self.temp_view, units)
-                        if bool(int(ConfigManager.get_config_value(measurement[0].name, display_config=True)))]
-                if not show:
-                    self.next_view()
-                    return
-                for i, (sensor_type, unit) in enumerate(show):
-                    value = self._readings.get(sensor_type)
-                    value_str = '---' if value is None else str(value)
-                    self._display.update_row(
-                        int(((i + 1) * self._display.rows / (len(show) + 1))),
-                        f"{sensor_type.name.capitalize()} = {value_str}{unit}",
-                        col=1
-                    )
+                show = [measurement for measurement in self.temp_view
+                        if self._is_enabled(measurement.name)]
+            self._show_cache[view] = show
+        return show
+
+    def _render_dust(self) -> None:
+        show = self._show_list(View.DUST)
+        if not show:
+            self._next_view()
+            return
+        for i, sensor_type in enumerate(show):
+            self._render_dust_row(i, sensor_type, len(show))
+
+    def _render_dust_row(self, i: int, sensor_type: SensorType, count: int) -> None:
+        """@brief paint one dust row; the label write pads the row, so no clear is needed"""
+        display = self._display
+        label, bounds, colors = DUST_THRESHOLDS[sensor_type]
+        value = self._readings.get(sensor_type)
+        value_str = '---' if value is None else str(value)
+        row = int(((i + 1) * display.rows / (count + 1)))
+        display.update_row(row, label, col=1)
+        if value is not None:
+            display.background_color(colors[bisect.bisect_right(bounds, value)])
+        display.update_row(row, f"{value_str} μg/m³", col=2 + len(label), fill=False)
+        display.reset()
+
+    def _render_temp(self) -> None:
+        show = self._show_list(View.TEMP_PRES_HUMI)
+        if not show:
+            self._next_view()
+            return
+        for i, sensor_type in enumerate(show):
+            self._render_temp_row(i, sensor_type, len(show))
+
+    def _render_temp_row(self, i: int, sensor_type: SensorType, count: int) -> None:
+        value = self._readings.get(sensor_type)
+        value_str = '---' if value is None else str(value)
+        self._display.update_row(
+            int(((i + 1) * self._display.rows / (count + 1))),
+            self._temp_templates[sensor_type].format(value_str),
+            col=1
+        )
 
     def update_sensor(self, sensor_type: SensorType):
         """@brief update sensor sensor_type if currently shown on screen"""
+        # unlocked peek is safe under the GIL: the debounce flush re-checks
+        # menu state authoritatively under the lock before painting
+        if self._current_menu is not None or self.display_off:
+            return
+        if sensor_type not in self._view_sensors[self.view]:
+            # not on screen; a view switch repaints everything anyway
+            return
+        value = self._readings.get(sensor_type)
+        with self._pending_lock:
+            # sensors often report the same rounded value; nothing visible changes then
+            if self._last_values.get(sensor_type, self) == value:
+                return
+            self._last_values[sensor_type] = value
+            self._pending_updates.add(sensor_type)
+            if self._redraw_timer is None:
+                # coalesce bursts from multiple sensor threads into one redraw;
+                # the sensor thread never waits on the UI lock or SPI transfer
+                self._redraw_timer = Timer(self.REDRAW_DELAY, self._flush_pending_updates)
+                self._redraw_timer.daemon = True
+                self._redraw_timer.start()
+
+    def _flush_pending_updates(self) -> None:
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._redraw_timer = None
+            pending = self._pending_updates
+            self._pending_updates = set()
         with self._lock, self._display:
-            if self._current_menu is None:
-                if self.view is View.DUST and sensor_type in self.dust_view:
-                    self.display_view()
-                elif self.view is View.TEMP_PRES_HUMI and sensor_type in self.temp_view:
-                    self.display_view()
+            if self._current_menu is None and not self.display_off:
+                # repaint only the affected rows, not clear + full view
+                if self.view is View.DUST:
+                    show = self._show_list(View.DUST)
+                    for i, sensor_type in enumerate(show):
+                        if sensor_type in pending:
+                            self._render_dust_row(i, sensor_type, len(show))
+                elif self.view is View.TEMP_PRES_HUMI:
+                    show = self._show_list(View.TEMP_PRES_HUMI)
+                    for i, sensor_type in enumerate(show):
+                        if sensor_type in pending:
+                            self._render_temp_row(i, sensor_type, len(show))
 
 
 class OnOffConfig(CallableMenuElement):
@@ -312,25 +499,28 @@ class OnOffConfig(CallableMenuElement):
     def call(self):
         self.on_off = not self.on_off
         ConfigManager.update_config_values({self.config_value: str(int(self.on_off))}, display_config=True)
+        Interface.invalidate_config(self.config_value)
         self.display_str = f"{self.base_display_str}: {'ON' if self.on_off else 'OFF'}"
 
 
 class PoweroffMenu(CallableMenuElement):
     def call(self):
         signal.raise_signal(signal.SIGINT)
-        time.sleep(2.5)
-        os.system("sudo shutdown now -h")
+        # wake as soon as teardown finished instead of always sleeping 2.5s
+        SHUTDOWN_READY.wait(timeout=2.5)
+        # no shell fork: exec sudo directly
+        subprocess.Popen(["sudo", "shutdown", "now", "-h"])  # pylint: disable=consider-using-with
 
 
 class RebootMenu(CallableMenuElement):
     def call(self):
         signal.raise_signal(signal.SIGINT)
-        time.sleep(2.5)
-        os.system("sudo reboot")
+        SHUTDOWN_READY.wait(timeout=2.5)
+        subprocess.Popen(["sudo", "reboot"])  # pylint: disable=consider-using-with
 
 
 class FreqencyChoice(Menu):
-    def __init__(self, display_str: str, display_config: bool, config_key: str, frequency_list: list[int]):
+    def __init__(self, display_str: str, display_config: bool, config_key: str, frequency_list: tuple[int, ...]):
         super().__init__("")
         self.config_key = config_key
         self.frequency_list = frequency_list
@@ -377,13 +567,21 @@ class FreqencyChoice(Menu):
                 {self.config_key: str(self.frequency_list[self.current_frequency])},
                 display_config=self.display_config
             )
+            if self.display_config:
+                Interface.invalidate_config(self.config_key)
             if self.parent:
                 self.parent.redraw()
             return self.parent
 
+    def close(self) -> Menu | None:
+        self.new_frequency = self.current_frequency
+        return self.parent
+
     def redraw(self) -> None:
-        self.display.clear()
-        self.display.update_row(0, self.base_display_str)
-        self.display.update_row(1, "^", col=2)
-        self.display.update_row(2, f"{self.frequency_list[self.new_frequency]}s".rjust(4))
-        self.display.update_row(3, "v", col=2)
+        # no clear(): print_lines blanks the unused rows itself, so nothing is drawn twice
+        self.display.print_lines([
+            self.base_display_str,
+            "  ^",
+            f"{self.frequency_list[self.new_frequency]}s".rjust(4),
+            "  v",
+        ])
@@ -10,7 +10,11 @@ from display import ST7789Display, ScreenDisplay
 from sensor_menu import get_menu
 from sensors import BMP280, DHT, PMSA003C, Sensor, SensorReadingError
 from util import ConfigManager, InfluxDatabase, SensorType, RepeatTimer, SensorReadings, Switch
-from menu import Interface, Key
+from menu import Interface, Key, SHUTDOWN_READY
+
+
+# config key -> SensorType, so reading the config walks the section once
+ST_BY_VALUE = {sensor_type.value: sensor_type for sensor_type in SensorType}
 
 
 class Device:
@@ -40,11 +44,13 @@ class Device:
         if not self.pi_gpio.connected:
             logging.error("Pigpio not connected!")
         else:
+            # one shared bound method instead of four lookups
+            key_press = self.interface.key_press
             self.switches = [
-                Switch(Key.UP, 5, self.pi_gpio, self.interface.key_press),
-                Switch(Key.DOWN, 19, self.pi_gpio, self.interface.key_press, long_push_time=0.5),
-                Switch(Key.CANCEL, 6, self.pi_gpio, self.interface.key_press),
-                Switch(Key.OK, 13, self.pi_gpio, self.interface.key_press)
+                Switch(Key.UP, 5, self.pi_gpio, key_press),
+                Switch(Key.DOWN, 19, self.pi_gpio, key_press, long_push_time=0.5),
+                Switch(Key.CANCEL, 6, self.pi_gpio, key_press),
+                Switch(Key.OK, 13, self.pi_gpio, key_press)
             ]
 
         self.sensor_timers = self._get_sensor_timers(readings, self.interface)
@@ -69,22 +75,23 @@ class Device:
     def close(self):
         for switch in self.switches:
             switch.clean()
-        self.config_timer.cancel()
-        self.config_timer.join(1)
-        for timer in self.sensor_timers.values():
+        # cancel everything first, then join: the timer threads wind down in parallel
+        timers = (self.config_timer, *self.sensor_timers.values())
+        for timer in timers:
             timer.cancel()
+        for timer in timers:
             timer.join(1)
         self.interface.close()
         self.database.close()
+        # unblocks PoweroffMenu/RebootMenu waiting to exec shutdown
+        SHUTDOWN_READY.set()
 
     def _get_current_conf(self) -> dict[SensorType, int]:
         config = ConfigManager.get_config(display_config=False)
-        sensor_conf = {}
-        for sensor_type in SensorType:
-            type_conf = sensor_type.value
-            if type_conf in config['sensors_config']:
-                sensor_conf[sensor_type] = int(config['sensors_config'][type_conf])
-        return sensor_conf
+        return {
+            ST_BY_VALUE[key]: int(value)
+            for key, value in config['sensors_config'].items() if key in ST_BY_VALUE
+        }
 
     def _get_sensor_timers(self, readings: SensorReadings, interface: Interface):
         def make_sensor(sensor_class: type[Sensor], *args) -> Sensor | None:
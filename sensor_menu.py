@@ -2,18 +2,25 @@ from menu import FreqencyChoice, MenuList, RebootMenu, OnOffConfig, PoweroffMenu
 from util import SensorType
 
 
+# frequency choices allocated once for the process lifetime
+DHT_FREQ = (5, 10, 15, 30, 60, 120, 240)
+PRESSURE_FREQ = (1, 2, 3, 5, 10, 15, 30, 60, 120, 240)
+PM_FREQ = (3, 5, 10, 15, 30, 60, 120, 240)
+VIEW_FREQ = (4, 5, 10, 20)
+
+
 def get_menu():
     return MenuList("", [
         MenuList("Measurements Period", [
-            FreqencyChoice("Humidity", False, SensorType.HUMIDITY.value, [5, 10, 15, 30, 60, 120, 240]),
-            FreqencyChoice("Temperature", False, SensorType.TEMPERATURE.value, [5, 10, 15, 30, 60, 120, 240]),
-            FreqencyChoice("Pressure", False, SensorType.PRESSURE.value, [1, 2, 3, 5, 10, 15, 30, 60, 120, 240]),
-            FreqencyChoice("PM1", False, SensorType.PM1.value, [3, 5, 10, 15, 30, 60, 120, 240]),
-            FreqencyChoice("PM2.5", False, SensorType.PM2_5.value, [3, 5, 10, 15, 30, 60, 120, 240]),
-            FreqencyChoice("PM10", False, SensorType.PM10.value, [3, 5, 10, 15, 30, 60, 120, 240]),
+            FreqencyChoice("Humidity", False, SensorType.HUMIDITY.value, DHT_FREQ),
+            FreqencyChoice("Temperature", False, SensorType.TEMPERATURE.value, DHT_FREQ),
+            FreqencyChoice("Pressure", False, SensorType.PRESSURE.value, PRESSURE_FREQ),
+            FreqencyChoice("PM1", False, SensorType.PM1.value, PM_FREQ),
+            FreqencyChoice("PM2.5", False, SensorType.PM2_5.value, PM_FREQ),
+            FreqencyChoice("PM10", False, SensorType.PM10.value, PM_FREQ),
         ]),
         MenuList("Display Settings", [
-            FreqencyChoice("View Period", True, "view_period", [4, 5, 10, 20]),
+            FreqencyChoice("View Period", True, "view_period", VIEW_FREQ),
             MenuList("Show Measurements", [
                 OnOffConfig("Temperature", SensorType.TEMPERATURE.name),
                 OnOffConfig("Humidity", SensorType.HUMIDITY.name),
@@ -4,6 +4,12 @@ import os
 import yaml
 import configparser
 
+try:
+    # libyaml-backed loader parses the specs ~10x faster when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 '''
 Set default measurement frequency for each sensor. Not included in the image.
 Used to generate sensors_config.ini.
@@ -15,16 +21,17 @@ CONFIG_FILE = "/etc/mini-air-quality/sensors_config.ini"
 
 if __name__ == '__main__':
     spec_filenames = list(filter(lambda file: "yaml" in file, os.listdir(SPECS_PATH)))
-    config = configparser.ConfigParser()
-    config.add_section("sensors_config")
+    envs = {}
 
     for spec_filename in spec_filenames:
         with open(SPECS_PATH+spec_filename, 'r') as spec_file:
-            sensors_data= yaml.load(spec_file, Loader=yaml.SafeLoader)
+            sensors_data = yaml.load(spec_file, Loader=SafeLoader)
             for sensor in sensors_data['sensors']:
-                sensor_env = sensor['env_name'].upper()
-                sensor_default_measure_freq = str(sensor['default_measure_freq'])
-                config.set("sensors_config", sensor_env, sensor_default_measure_freq)
-    
+                envs[sensor['env_name'].upper()] = str(sensor['default_measure_freq'])
+
+    config = configparser.ConfigParser()
+    # one section assignment instead of per-key set() calls
+    config['sensors_config'] = envs
+
     with open(CONFIG_FILE, 'w') as config_file:
         config.write(config_file)
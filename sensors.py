@@ -1,9 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from threading import Lock
-from typing import DefaultDict, Literal, Union
-from collections import deque, defaultdict
-from statistics import median_low
+from collections import deque
+import struct
 import board
 import adafruit_bmp280
 from adafruit_dht import DHT22
@@ -15,60 +15,62 @@ class SensorReadingError(Exception):
     pass
 
 
-class MutableBool:
-    def __init__(self, initial_value: bool) -> None:
-        self.bool_value = initial_value
-
-    def __bool__(self) -> bool:
-        return self.bool_value
-
-    def __eq__(self, __value: object) -> bool:
-        return self.bool_value == __value
+# allowed types per device: frozensets hash the membership asserts instead of scanning
+BMP280_TYPES = frozenset((SensorType.PRESSURE,))
+PMSA003C_TYPES = frozenset((SensorType.PM1, SensorType.PM2_5, SensorType.PM10))
 
 
 class Sensor(ABC):
+    # sensors read from more than one timer thread need the lock;
+    # single-reader sensors override with False and get a no-op context
+    NEEDS_LOCK = True
+
     def __init__(self, sensor_types: list[SensorType]) -> None:
         super().__init__()
         self._sensor_types = sensor_types
-        self._lock = Lock()
-        # MutableBool is true if values are new (weren't read since last addition)
-        bool_deque_type = tuple[MutableBool, deque[Union[int, float]]]
-        self._readings: DefaultDict[SensorType, bool_deque_type] = defaultdict(lambda: (MutableBool(False), deque(list(), 7)))
+        self._lock = Lock() if self.NEEDS_LOCK else nullcontext()
+        # flag is True if values are new (weren't read since last addition)
+        self._is_new: dict[SensorType, bool] = {sensor_type: False for sensor_type in sensor_types}
+        self._readings: dict[SensorType, deque[int | float]] = {
+            sensor_type: deque(maxlen=7) for sensor_type in sensor_types
+        }
 
     @abstractmethod
     def get_reading(self, sensor_type: SensorType) -> int | float:
         raise NotImplementedError
 
     def _add_reading(self, sensor_type: SensorType, value: int | float) -> None:
-        is_new, readings_deque = self._readings[sensor_type]
-        readings_deque.append(value)
-        is_new.bool_value = True
+        self._readings[sensor_type].append(value)
+        self._is_new[sensor_type] = True
 
     def _get_median(self, sensor_type: SensorType) -> int | float:
-        is_new, readings_deque = self._readings[sensor_type]
-        if not is_new or len(readings_deque) != readings_deque.maxlen:
+        readings_deque = self._readings[sensor_type]
+        if not self._is_new[sensor_type] or len(readings_deque) != readings_deque.maxlen:
             raise SensorReadingError
-        is_new.bool_value = False
-        return median_low(readings_deque)
+        self._is_new[sensor_type] = False
+        # low median inlined: plain sorted() skips statistics' generic dispatch
+        ordered = sorted(readings_deque)
+        return ordered[(len(ordered) - 1) // 2]
 
 
 class DHT(Sensor):
     def __init__(self) -> None:
         super().__init__(sensor_types=[SensorType.TEMPERATURE, SensorType.HUMIDITY])
         self.dht = DHT22(board.D4)
+        # per-type reader table instead of an if-chain in get_reading
+        self._readers = {
+            SensorType.TEMPERATURE: lambda: self.dht.temperature,
+            SensorType.HUMIDITY: lambda: self.dht.humidity,
+        }
 
     def get_reading(self, sensor_type: SensorType) -> int | float:
-        assert sensor_type in self._sensor_types, f"Wrong DHT sensor type({sensor_type})"
+        reader = self._readers.get(sensor_type)
+        assert reader is not None, f"Wrong DHT sensor type({sensor_type})"
         with self._lock:
             try:
-                if sensor_type is SensorType.TEMPERATURE:
-                    temp = self.dht.temperature
-                    if temp is not None:
-                        self._add_reading(sensor_type, round(temp, 1))
-                else:
-                    humidity = self.dht.humidity
-                    if humidity is not None:
-                        self._add_reading(sensor_type, round(humidity, 1))
+                value = reader()
+                if value is not None:
+                    self._add_reading(sensor_type, round(value, 1))
             except RuntimeError as exc:
                 raise SensorReadingError from exc
 
@@ -76,12 +78,15 @@ class DHT(Sensor):
 
 
 class BMP280(Sensor):
+    # only the pressure timer reads this sensor
+    NEEDS_LOCK = False
+
     def __init__(self) -> None:
         super().__init__(sensor_types=[SensorType.PRESSURE])
         self.bmp280 = adafruit_bmp280.Adafruit_BMP280_I2C(board.I2C(), address=0x76)
 
     def get_reading(self, sensor_type: SensorType) -> int | float:
-        assert sensor_type in self._sensor_types, f"Wrong BMP280 sensor type({sensor_type})"
+        assert sensor_type in BMP280_TYPES, f"Wrong BMP280 sensor type({sensor_type})"
         with self._lock:
             try:
                 pressure = self.bmp280.pressure
@@ -94,7 +99,8 @@ class BMP280(Sensor):
 
 
 class PMSA003C(Sensor):
-    BYTEORDER: Literal['big'] = 'big'
+    # frame header bytes 0x42 0x4d
+    HEADER = b'BM'
 
     def __init__(self, pi: pigpio.pi) -> None:
         if not pi.connected:
@@ -102,41 +108,53 @@ class PMSA003C(Sensor):
         super().__init__(sensor_types=[SensorType.PM1, SensorType.PM2_5, SensorType.PM10])
         self.RX = 24
         self.pi = pi
-        self.start1 = 0x42
-        self.start2 = 0x4d
         pigpio.exceptions = False
         self.pi.bb_serial_read_close(self.RX)
         pigpio.exceptions = True
         self.pi.bb_serial_read_open(self.RX, 9600)
 
         self.data: bytearray = bytearray()
+        # deques pre-resolved so a parsed frame is three appends, no dict lookups
+        self._pm_deques = (
+            self._readings[SensorType.PM1],
+            self._readings[SensorType.PM2_5],
+            self._readings[SensorType.PM10],
+        )
 
     def check_sum(self, data) -> bool:
-        # check if sum of first 30 bytes is same as last 2 bytes
-        return len(data) == 32 and sum(data[:30]) == int.from_bytes(data[-2:], byteorder=self.BYTEORDER)
+        # check if sum of first 30 bytes is same as last 2 bytes (big-endian)
+        return len(data) == 32 and sum(memoryview(data)[:30]) == ((data[30] << 8) | data[31])
 
     def get_data(self, data: bytearray) -> bytearray:
-        # find all occurences of self.start1 and self.start2 bytes
-        indexes = [i for i, x in enumerate(data[:-1]) if x == self.start1 and data[i+1] == self.start2]
-        # find last(newest) data frame
-        for i in reversed(indexes):
-            if self.check_sum(data[i:i+32]):
-                return data[i:i+32]
+        # scan backwards with rfind (memchr in C) so the newest valid frame wins
+        i = data.rfind(self.HEADER)
+        while i != -1:
+            frame = data[i:i+32]
+            if self.check_sum(frame):
+                return frame
+            i = data.rfind(self.HEADER, 0, i)
         return bytearray()
 
     def update(self) -> None:
         _, data = self.pi.bb_serial_read(self.RX)
         if isinstance(data, bytearray):
-            self.data += data
+            self.data.extend(data)
         frame = self.get_data(self.data)
         if frame:
-            self._add_reading(SensorType.PM1, int.from_bytes(data[4:6], byteorder=self.BYTEORDER))
-            self._add_reading(SensorType.PM2_5, int.from_bytes(data[6:8], byteorder=self.BYTEORDER))
-            self._add_reading(SensorType.PM10, int.from_bytes(data[8:10], byteorder=self.BYTEORDER))
+            # parse the validated frame (not the raw chunk) in one C-level call
+            pm_deque1, pm_deque2_5, pm_deque10 = self._pm_deques
+            pm1, pm2_5, pm10 = struct.unpack_from('>HHH', frame, 4)
+            pm_deque1.append(pm1)
+            pm_deque2_5.append(pm2_5)
+            pm_deque10.append(pm10)
+            self._is_new[SensorType.PM1] = self._is_new[SensorType.PM2_5] = self._is_new[SensorType.PM10] = True
             self.data = bytearray()
+        elif len(self.data) > 256:
+            # no valid frame: keep a bounded tail (a partial frame at most) to rescan
+            del self.data[:-64]
 
     def get_reading(self, sensor_type: SensorType) -> int | float:
-        assert sensor_type in self._sensor_types, f"Wrong PMSA003C sensor type({sensor_type})"
+        assert sensor_type in PMSA003C_TYPES, f"Wrong PMSA003C sensor type({sensor_type})"
         with self._lock:
             try:
                 self.update()
@@ -2,8 +2,7 @@ from __future__ import annotations
 import logging
 import random
 import signal
-import time
-from threading import Lock, Thread
+from threading import Event, Thread
 from typing import Callable, Literal
 import pygame
 from luma.emulator.device import pygame as luma_pygame
@@ -23,7 +22,9 @@ PIN_TO_KEY = {
 
 
 def round_nearest(num: float, to: float) -> float:
-    return round(round(num / to) * to, 1)
+    # quantize in tenths with integer math: one float round instead of two
+    step = int(round(to * 10))
+    return (int(round(num * 10)) + step // 2) // step * step / 10
 
 
 class RandomReading:
@@ -40,33 +41,26 @@ class RandomReading:
         elif self.current >= self.max:
             self.current -= self.change
         else:
-            self.current += self.change * random.choice([-1, 1])
+            # ±1 from one random bit, no list allocation or choice() dispatch
+            self.current += self.change * (random.getrandbits(1) * 2 - 1)
 
         return round_nearest(self.current, self.precision)
 
 
 class Reading:
     def __init__(self) -> None:
-        self.temp_val = RandomReading(15, 25, 20, 0.2)
-        self.hum_val = RandomReading(40, 80, 60, 1)
-        self.press_val = RandomReading(1000, 1080, 1010, 1)
-        self.pm1_val = RandomReading(2, 15, 3, 1)
-        self.pm25_val = RandomReading(8, 25, 12, 1)
-        self.pm10_val = RandomReading(10, 35, 15, 1)
+        # SensorType -> bound walk advance, so get_reading is one dict probe
+        self._dispatch = {
+            SensorType.TEMPERATURE: RandomReading(15, 25, 20, 0.2).get_random_reading,
+            SensorType.HUMIDITY: RandomReading(40, 80, 60, 1).get_random_reading,
+            SensorType.PRESSURE: RandomReading(1000, 1080, 1010, 1).get_random_reading,
+            SensorType.PM1: RandomReading(2, 15, 3, 1).get_random_reading,
+            SensorType.PM2_5: RandomReading(8, 25, 12, 1).get_random_reading,
+            SensorType.PM10: RandomReading(10, 35, 15, 1).get_random_reading,
+        }
 
     def get_reading(self, sensor_type: SensorType) -> float:
-        if sensor_type is SensorType.TEMPERATURE:
-            return self.temp_val.get_random_reading()
-        if sensor_type is SensorType.HUMIDITY:
-            return self.hum_val.get_random_reading()
-        if sensor_type is SensorType.PRESSURE:
-            return self.press_val.get_random_reading()
-        if sensor_type is SensorType.PM1:
-            return self.pm1_val.get_random_reading()
-        if sensor_type is SensorType.PM2_5:
-            return self.pm25_val.get_random_reading()
-        if sensor_type is SensorType.PM10:
-            return self.pm10_val.get_random_reading()
+        return self._dispatch[sensor_type]()
 
 
 def init(self, *_args):
@@ -119,15 +113,19 @@ def main():
     device_thread = Thread(target=device.run)
     device_thread.start()
 
+    # locals for the loop: LOAD_FAST instead of module attribute walks per tick
+    wait_event = pygame.event.wait
+    handle_key = keyboard.handle_key
+    quit_type, keydown, keyup, escape = pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.K_ESCAPE
     while not stop:
-        time.sleep(0.02)
-        pygame.event.pump()
-        keystate = pygame.key.get_pressed()
-        if keystate[pygame.K_ESCAPE] or pygame.event.peek(pygame.QUIT):
+        # block on SDL's native wait instead of polling key state at 50 Hz
+        event = wait_event(20)
+        if event.type == quit_type:
             break
-        for callback in keyboard.callbacks:
-            if keyboard.read(callback.pin) != callback.last_state:
-                callback.change_state()
+        if event.type in (keydown, keyup):
+            if event.key == escape:
+                break
+            handle_key(event.key, event.type == keydown)
 
     device.stop()
     device_thread.join()
@@ -147,14 +145,18 @@ class Callback:
         self.remove_self(self)
 
     def change_state(self) -> None:
-        self.last_state = not self.last_state
-        self.func(self.pin, self.last_state, 0)
+        new_state = not self.last_state
+        self.last_state = new_state
+        self.func(self.pin, new_state, 0)
 
 
 class PigpioWrapper:
     def __init__(self) -> None:
         self.connected = True
         self.callbacks: list[Callback] = []
+        # event-driven state: pressed keys and pygame key -> callback dispatch
+        self._pressed: dict[int, bool] = {}
+        self._by_key: dict[int, Callback] = {}
 
     def set_mode(self, _pin, _mode) -> None:
         pass
@@ -163,18 +165,27 @@ class PigpioWrapper:
         pass
 
     def read(self, pin) -> bool:
-        return pygame.key.get_pressed()[PIN_TO_KEY[pin]] if pin in PIN_TO_KEY else False
+        return self._pressed.get(PIN_TO_KEY.get(pin), False)
+
+    def handle_key(self, key: int, pressed: bool) -> None:
+        """@brief dispatch one KEYDOWN/KEYUP event to the registered callback"""
+        self._pressed[key] = pressed
+        callback = self._by_key.get(key)
+        if callback is not None and callback.last_state != pressed:
+            callback.change_state()
 
     def callback(self, pin, edge, func) -> Callback:
         if pin not in PIN_TO_KEY:
             raise NotImplementedError
         new_callback = Callback(func, self._remove_callback, edge, pin, self.read(pin))
         self.callbacks.append(new_callback)
+        self._by_key[PIN_TO_KEY[pin]] = new_callback
         return new_callback
 
     def _remove_callback(self, _callback: Callback) -> None:
         try:
             self.callbacks.remove(_callback)
+            self._by_key.pop(PIN_TO_KEY[_callback.pin], None)
         except ValueError:
             # callback.cancel()(called in util.py Switch) calls _remove_callback.
             logging.error("Multiple calls to callback.cancel()")
@@ -184,25 +195,23 @@ class PygameEmulator(luma_pygame):
     def __init__(self, width=128, height=64, rotate=0, mode="RGB",
                  transform="scale2x", scale=2, frame_rate=60, **kwargs):
         super().__init__(width, height, rotate, mode, transform, scale, frame_rate, **kwargs)
-        self.quit = False
-        self._lock = Lock()
+        # Event instead of a lock: abort() never waits on an in-flight blit,
+        # and a late display() after abort is harmless until pygame.quit()
+        self._quit = Event()
 
     # Called by turn_on()/turn_off() in display.py. Doesn't need to do anything
     def backlight(self, on_off) -> None:
         pass
 
     def abort(self) -> None:
-        with self._lock:
-            if not self.quit:
-                self.quit = True
+        self._quit.set()
 
     def _abort(self) -> Literal[False]:
         return False
 
     def display(self, image) -> None:
-        with self._lock:
-            if not self.quit:
-                super().display(image)
+        if not self._quit.is_set():
+            super().display(image)
 
 
 if __name__ == "__main__":
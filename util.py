@@ -1,22 +1,25 @@
 from __future__ import annotations
 from configparser import ConfigParser
 from contextlib import AbstractContextManager, nullcontext
-from copy import deepcopy
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 import fcntl
-import functools
-from io import TextIOWrapper
+from io import StringIO, TextIOWrapper
+import os
 import logging
 from pathlib import Path
-from threading import Lock, RLock, Timer, Condition
+from threading import Condition, Event, Lock, Thread
+import time
 from typing import Callable, TypedDict
 import pigpio
 import influxdb_client
-from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client import WritePrecision
+from influxdb_client.client.write_api import WriteOptions, WriteType
 from influxdb_client.rest import ApiException
 from urllib3.exceptions import NewConnectionError
 
 
+log = logging.getLogger(__name__)
+
 CONFIG = {
     "sensor_file": "/etc/mini-air-quality/sensors_config.ini",
     "sensor_section": "sensors_config",
@@ -35,13 +38,17 @@ class SensorType(Enum):
     PM10 = "particle_pm10_pmsa003-c_freq"
 
     @classmethod
-    @functools.cache
     def index(cls, sensor_type: SensorType) -> int:
         """@brief Returns index of element"""
-        return list(SensorType).index(sensor_type)
+        return SENSOR_INDEX[sensor_type]
+
+
+# definition-order index built once; also avoids functools.cache pinning cls
+SENSOR_INDEX = {sensor_type: i for i, sensor_type in enumerate(SensorType)}
 
 
-class Key(Enum):
+class Key(IntEnum):
+    # IntEnum so comparisons take the int-int fast path
     UP = auto()
     DOWN = auto()
     OK = auto()
@@ -49,9 +56,12 @@ class Key(Enum):
 
 
 class InfluxDatabase:
-    def __init__(self) -> None:
-        self._lock = Lock()
+    # write errors are counted and reported at most this often
+    ERROR_LOG_PERIOD = 60.0
 
+    def __init__(self) -> None:
+        self._error_count = 0
+        self._last_error_log = float("-inf")
         url = "http://localhost:8086"
         self.org = "mini_air_quality"
         self.bucket = "sensor_data"
@@ -59,26 +69,60 @@ class InfluxDatabase:
         self.password = "mini_air_quality"
         self.token = "6y-fM0HpRAwx1P-fbH_3DaXklPqyFlAzUd58STICzqAlIcOks55jpjhyf6udF-nCykZTLzRMor48r279jfFWWw=="
         self.client = influxdb_client.InfluxDBClient(
-            url=url, org=self.org, username=self.username, password=self.password, token=self.token
+            url=url, org=self.org, username=self.username, password=self.password, token=self.token,
+            # line protocol is highly repetitive; gzip the write bodies
+            enable_gzip=True
         )
-        self.write_api = self.client.write_api(write_options=SYNCHRONOUS)
+        # per-measurement line-protocol prefixes: writing a sample is string
+        # concat + enqueue, no Point construction/serialization
+        self._lp_prefix = {sensor_type: f"{sensor_type.name} value=" for sensor_type in SensorType}
+        # batching mode: add() just queues the point; the client's worker thread
+        # flushes line-protocol batches instead of one HTTP POST per sample
+        self.write_api = self.client.write_api(
+            write_options=WriteOptions(
+                write_type=WriteType.batching,
+                batch_size=500,
+                flush_interval=2_000,
+                jitter_interval=500,
+                retry_interval=5_000,
+            ),
+            error_callback=self._on_write_error,
+        )
+
+    def _on_write_error(self, _conf: tuple[str, str, str], _data: str, exception: Exception) -> None:
+        self._log_write_error(exception)
+
+    def _log_write_error(self, exception: Exception) -> None:
+        """@brief rate-limited: with the database down every batch fails identically"""
+        self._error_count += 1
+        now = time.monotonic()
+        if now - self._last_error_log > self.ERROR_LOG_PERIOD:
+            self._last_error_log = now
+            log.warning("InfluxDB write errors (%d since last report): %s", self._error_count, exception)
+            self._error_count = 0
 
     def close(self) -> None:
         self.write_api.close()
         self.client.close()
 
     def add(self, sensor_type: SensorType, value: int | float) -> None:
-        with self._lock:
-            point = influxdb_client.Point(sensor_type.name).field("value", value)
-            try:
-                self.write_api.write(bucket=self.bucket, org=self.org, record=point)
-            except NewConnectionError as exc:
-                logging.error("InfluxDB Connection error, couldn't write: %s", exc)
-            except ApiException as exc:
-                logging.error("InfluxDB ApiException, couldn't write: %s", exc)
+        # no lock: the batching WriteApi is internally thread-safe
+        # same field types Point would emit: trailing 'i' marks integers
+        suffix = f"{value}i" if isinstance(value, int) else str(float(value))
+        # sampling is seconds-scale: stamp client-side at second precision so
+        # batching can't skew timestamps and lines drop the nanosecond digits
+        record = f"{self._lp_prefix[sensor_type]}{suffix} {int(time.time())}"
+        try:
+            self.write_api.write(bucket=self.bucket, org=self.org, record=record, write_precision=WritePrecision.S)
+        except (NewConnectionError, ApiException) as exc:
+            self._log_write_error(exc)
 
 
 class SensorReadings:
+    # repeated identical values are still written this often, so the series
+    # keeps a heartbeat and last() stays fresh
+    MAX_WRITE_AGE = 60.0
+
     def __init__(self, database: InfluxDatabase) -> None:
         self.readings: dict[SensorType, int | float | None] = {
             SensorType.TEMPERATURE: None,
@@ -88,61 +132,97 @@ class SensorReadings:
             SensorType.PM2_5: None,
             SensorType.PM10: None,
         }
+        self._last_write: dict[SensorType, float] = {}
         self.database = database
 
     def get(self, sensor_type: SensorType) -> int | float | None:
         return self.readings[sensor_type]
 
     def add(self, sensor_type: SensorType, value: int | float) -> None:
+        previous = self.readings[sensor_type]
         self.readings[sensor_type] = value
+        now = time.monotonic()
+        if value == previous and now - self._last_write.get(sensor_type, float("-inf")) < self.MAX_WRITE_AGE:
+            return
+        self._last_write[sensor_type] = now
         self.database.add(sensor_type, value)
 
 
-class ResettableTimer(Timer):
-    """call start to initialize, call reset to 'start' timer"""
-    def __init__(self, interval: float, function: Callable[..., object], *args, **kwargs) -> None:
-        super().__init__(interval, function, args, kwargs)
-        self._function_wait = Condition()
+class DeadlineScheduler(Thread):
+    """One daemon thread multiplexing any number of resettable one-shot deadlines.
+    add_slot registers (interval, function, args); reset(slot) (re)arms it, stop(slot) disarms it.
+    """
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self._slots: list[tuple[float, Callable[..., object], tuple]] = []
+        self._deadlines: list[float] = []
+        self._cond = Condition()
         self._end = False
 
+    def add_slot(self, interval: float, function: Callable[..., object], args: tuple = ()) -> int:
+        """@brief register a deadline slot; returns its id for reset/stop"""
+        with self._cond:
+            self._slots.append((interval, function, args))
+            self._deadlines.append(float("inf"))
+            return len(self._slots) - 1
+
+    def reset(self, slot: int) -> None:
+        """@brief (re)arm slot to fire after its interval"""
+        with self._cond:
+            self._deadlines[slot] = time.monotonic() + self._slots[slot][0]
+            self._cond.notify()
+
+    def stop(self, slot: int) -> None:
+        """@brief disarm slot"""
+        with self._cond:
+            self._deadlines[slot] = float("inf")
+            self._cond.notify()
+
     def cancel(self) -> None:
-        with self._function_wait:
-            super().cancel()
+        with self._cond:
             self._end = True
-            self._function_wait.notify()
-
-    def stop(self) -> None:
-        """@brief stop timer and wait for cancel or reset"""
-        with self._function_wait:
-            self._function_wait.notify()
-
-    def reset(self, interval: float | None = None) -> None:
-        """@brief restart timer with different interval if not None"""
-        with self._function_wait:
-            if interval is not None:
-                self.interval = interval
-            self._function_wait.notify()
-            self.finished.set()
+            self._cond.notify()
 
     def run(self) -> None:
-        while self.finished.wait():
-            with self._function_wait:
+        # loop state bound once; this thread wakes on every GPIO edge
+        # (slots are appended in place, so the local aliases stay valid)
+        cond = self._cond
+        deadlines = self._deadlines
+        slots = self._slots
+        inf = float("inf")
+        while True:
+            fire = []
+            with cond:
                 if self._end:
                     break
-                self.finished.clear()
-                finished_wait = not self._function_wait.wait(self.interval)
-            if finished_wait:
-                self.function(*self.args, **self.kwargs)
-
-
-class RepeatTimer(Timer):
+                now = time.monotonic()
+                upcoming = min(deadlines, default=inf)
+                if upcoming > now:
+                    cond.wait(None if upcoming == inf else upcoming - now)
+                    continue
+                for slot, deadline in enumerate(deadlines):
+                    if deadline <= now:
+                        deadlines[slot] = inf
+                        fire.append(slot)
+            # fire outside the condition so callbacks can't deadlock against reset/stop
+            for slot in fire:
+                _, function, args = slots[slot]
+                function(*args)
+
+
+class RepeatTimer(Thread):
     def __init__(self, interval: float, function: Callable[..., object], *args, **kwargs) -> None:
-        super().__init__(interval, function, args, kwargs)
+        super().__init__()
+        self.interval = interval
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.finished = Event()
         self.stop = False
 
     def cancel(self) -> None:
         self.stop = True
-        super().cancel()
+        self.finished.set()
 
     def reset(self, new_interval: float | None = None) -> None:
         if new_interval is not None:
@@ -150,13 +230,27 @@ class RepeatTimer(Timer):
         self.finished.set()
 
     def run(self) -> None:
+        # bind the loop invariants; interval/stop stay attribute reads on purpose,
+        # reset() and cancel() change them from other threads
+        finished = self.finished
+        function, args, kwargs = self.function, self.args, self.kwargs
         while not self.stop:
-            if not self.finished.wait(self.interval):
-                self.function(*self.args, **self.kwargs)
-            self.finished.clear()
+            if not finished.wait(self.interval):
+                function(*args, **kwargs)
+            finished.clear()
 
 
 class Switch:
+    # every switch shares one scheduler thread for its debounce/long-press deadlines
+    _scheduler: DeadlineScheduler | None = None
+
+    @classmethod
+    def _get_scheduler(cls) -> DeadlineScheduler:
+        if cls._scheduler is None:
+            cls._scheduler = DeadlineScheduler()
+            cls._scheduler.start()
+        return cls._scheduler
+
     def __init__(
             self,
             key: Key,
@@ -175,65 +269,67 @@ class Switch:
         pi_gpio.set_mode(pin, pigpio.INPUT)
         pi_gpio.set_pull_up_down(pin, pigpio.PUD_DOWN)
         self.current_state = pi_gpio.read(pin)
-        self._lock = Lock()
-        self._debounce_timer = ResettableTimer(debounce, self.change_state)
-        self._debounce_timer.start()
-        self._long_timer = ResettableTimer(long_push_time, callback, self.key, True)
-        self._long_timer.start()
+        self._timer = self._get_scheduler()
+        self._debounce_slot = self._timer.add_slot(debounce, self.change_state)
+        self._long_slot = self._timer.add_slot(long_push_time, callback, (key, True))
+        # indexed by level ^ current_state: 0 = bounced back (stop), 1 = new edge (reset)
+        self._edge_actions = (
+            lambda: self._timer.stop(self._debounce_slot),
+            lambda: self._timer.reset(self._debounce_slot),
+        )
         self._edge_callback = pi_gpio.callback(pin, pigpio.EITHER_EDGE, self.edge_change)
         self.callback = callback
 
     def edge_change(self, _1, level, _2) -> None:
-        with self._lock:
-            if level != 2:
-                if level != self.current_state:
-                    self._debounce_timer.reset()
-                else:
-                    self._debounce_timer.stop()
+        if level >= 2:  # pigpio watchdog timeout
+            return
+        # lock-free: current_state is only written by the timer thread and the
+        # GIL makes the read atomic; a racing edge at worst re-arms the
+        # debounce timer once, which reset() handles idempotently
+        self._edge_actions[level ^ self.current_state]()
 
     def change_state(self) -> None:
         self.current_state = not self.current_state
         if self.current_state:
             self.callback(self.key, False)
-            self._long_timer.reset()
+            self._timer.reset(self._long_slot)
         else:
-            self._long_timer.stop()
+            self._timer.stop(self._long_slot)
 
     def clean(self) -> None:
         """@brief Call when done using switch."""
         self._edge_callback.cancel()
-        self._debounce_timer.cancel()
-        self._long_timer.cancel()
-        self._debounce_timer.join(1)
-        self._long_timer.join(1)
+        # the shared scheduler keeps running (daemon); just disarm this switch
+        self._timer.stop(self._debounce_slot)
+        self._timer.stop(self._long_slot)
 
 
 class FileLock:
     def __init__(self, lock_filepath: str) -> None:
         self.depth = 0
         self.lock_filepath = lock_filepath
+        # opened lazily on first use, then kept open: flock works on the
+        # same fd for the process lifetime instead of open/close per lock
         self.lock_file: TextIOWrapper | None = None
 
     def __enter__(self) -> None:
         if self.depth == 0:
-            self.lock_file = open(self.lock_filepath, "w", encoding="utf-8")
-            try:
-                fcntl.flock(self.lock_file, fcntl.LOCK_EX)
-            except Exception:
-                self.lock_file.close()
-                self.lock_file = None
-                raise
+            if self.lock_file is None:
+                self.lock_file = open(self.lock_filepath, "w", encoding="utf-8")
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX)
         self.depth += 1
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.depth -= 1
         if self.depth == 0:
             assert isinstance(self.lock_file, TextIOWrapper)
-            try:
-                fcntl.flock(self.lock_file, fcntl.LOCK_UN)
-            finally:
-                self.lock_file.close()
-                self.lock_file = None
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """@brief release the kept-open lock fd; the lock must not be held"""
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
 
 
 class ConfigManager:
@@ -242,99 +338,149 @@ class ConfigManager:
         file_lock: AbstractContextManager
         st_mtime: float
         config: ConfigParser | None
+        snapshot: dict[str, dict[str, str]]
+        last_check: float
 
-    _lock = RLock()
+    # how long a cached config is trusted without re-stating the file
+    CHECK_TTL = 1.0
+
+    # plain Lock: every internal path below acquires it exactly once
+    _lock = Lock()
     _config_cache: ConfigCache = {
         "config_file": CONFIG["sensor_file"],
         "file_lock": FileLock(CONFIG["sensor_lock"]),
         "st_mtime": float('-inf'),
-        "config": None
+        "config": None,
+        "snapshot": {},
+        "last_check": float('-inf')
     }
     _display_cache: ConfigCache = {
         "config_file": CONFIG["display_file"],
         "file_lock": nullcontext(),
         "st_mtime": float('-inf'),
-        "config": None
+        "config": None,
+        "snapshot": {},
+        "last_check": float('-inf')
     }
+    # resolved once: cache and section keyed by the display_config flag
+    _CACHES = {True: _display_cache, False: _config_cache}
+    _SECTION = {True: CONFIG["display_section"], False: CONFIG["sensor_section"]}
+
+    @staticmethod
+    def _snapshot(config: ConfigParser) -> dict[str, dict[str, str]]:
+        return {section: dict(config[section]) for section in config.sections()}
+
+    @staticmethod
+    def _read_config(cache: ConfigCache) -> ConfigParser:
+        """@brief parse the config file with one open, taking mtime from the open fd"""
+        config = ConfigParser(interpolation=None)
+        with cache["file_lock"]:
+            with open(cache["config_file"], "r", encoding="utf-8") as file:
+                cache["st_mtime"] = os.fstat(file.fileno()).st_mtime
+                data = file.read()
+        config.read_string(data)
+        return config
 
     @classmethod
     def is_cache_current(cls, *, display_config: bool) -> bool:
         """Return False if config isn't cached or file was modified since last cached"""
         with cls._lock:
-            cache = cls._display_cache if display_config else cls._config_cache
+            cache = cls._CACHES[display_config]
             return cache["config"] is not None and cache["st_mtime"] == Path(cache["config_file"]).stat().st_mtime
 
     @classmethod
-    def _get_config(cls, *, display_config: bool) -> ConfigParser:
-        with cls._lock:
-            if display_config and cls._display_cache["config"]:
-                logging.debug("%s: cached display config", cls._display_cache["config_file"])
-                return cls._display_cache["config"]
-            cache = cls._display_cache if display_config else cls._config_cache
-            config_file = cache["config_file"]
-            configpath = Path(config_file)
-            config = cache["config"]
-            if config is None:
-                config = ConfigParser()
-                with cache["file_lock"]:
-                    config.read(config_file)
-                logging.debug("%s: loaded config: not cached", config_file)
-                cache["st_mtime"] = configpath.stat().st_mtime
+    def _get_config_locked(cls, *, display_config: bool) -> ConfigParser:
+        """@brief load or revalidate the cached config. Call with cls._lock held"""
+        if display_config and cls._display_cache["config"]:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s: cached display config", cls._display_cache["config_file"])
+            return cls._display_cache["config"]
+        cache = cls._CACHES[display_config]
+        config_file = cache["config_file"]
+        config = cache["config"]
+        if config is None:
+            config = cls._read_config(cache)
+            log.debug("%s: loaded config: not cached", config_file)
+            cache["last_check"] = time.monotonic()
+            cache["config"] = config
+            cache["snapshot"] = cls._snapshot(config)
+        else:
+            now = time.monotonic()
+            if now - cache["last_check"] < cls.CHECK_TTL:
+                # recently validated: skip the stat syscall entirely
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("%s: cached config", config_file)
+                return config
+            cache["last_check"] = now
+            if Path(config_file).stat().st_mtime != cache["st_mtime"]:
+                log.debug("%s: loaded config: file changed", config_file)
+                config = cls._read_config(cache)
                 cache["config"] = config
-            else:
-                st_mtime = configpath.stat().st_mtime
-                if st_mtime != cache["st_mtime"]:
-                    logging.debug("%s: loaded config: file changed", config_file)
-                    cache["st_mtime"] = st_mtime
-                    config = ConfigParser()
-                    with cache["file_lock"]:
-                        config.read(config_file)
-                    cache["config"] = config
-                else:
-                    logging.debug("%s: cached config", config_file)
-            return config
+                cache["snapshot"] = cls._snapshot(config)
+            elif log.isEnabledFor(logging.DEBUG):
+                log.debug("%s: cached config", config_file)
+        return config
 
     @classmethod
-    def get_config(cls, *, display_config: bool) -> ConfigParser:
+    def get_config(cls, *, display_config: bool) -> dict[str, dict[str, str]]:
         """
-        If config not in cache then load from file.
-        If config is in cache and is current or internal_config == True then return cache copy
-        If config file was modified after caching then reload from file
+        Return the cached config as a plain section -> {key: value} snapshot.
+        The snapshot is rebuilt when the file changes and never mutated in
+        place, so no copy is needed.
         """
-        logging.debug("deepcopy(display_config=%s)", display_config)
-        try:
-            config = cls._get_config(display_config=display_config)
-        except OSError:
-            logging.exception("_get_config exception")
-            config = ConfigParser()
-        return deepcopy(config)
+        with cls._lock:
+            try:
+                cls._get_config_locked(display_config=display_config)
+            except OSError:
+                log.exception("_get_config exception")
+                return {}
+            cache = cls._CACHES[display_config]
+            return cache["snapshot"]
 
     @classmethod
     def get_config_value(cls, key: str, *, display_config: bool) -> str | None:
         """@brief Return value of config with key=key. If key doesn't exist return None"""
-        config_section = CONFIG["display_section"] if display_config else CONFIG["sensor_section"]
+        config_section = cls._SECTION[display_config]
         with cls._lock:
             try:
-                config = cls._get_config(display_config=display_config)
+                config = cls._get_config_locked(display_config=display_config)
                 return str(config[config_section][key])
             except KeyError:
-                logging.error("Key %s or section %s doesn't exist!(display_config=%s)\n", key, config_section, display_config)
+                log.error("Key %s or section %s doesn't exist!(display_config=%s)\n", key, config_section, display_config)
                 return None
             except OSError:
-                logging.exception("_get_config exception")
+                log.exception("_get_config exception")
                 return None
 
     @classmethod
     def update_config_values(cls, key_value: dict[str, str], *, display_config: bool) -> None:
-        cache = cls._display_cache if display_config else cls._config_cache
-        config_section = CONFIG["display_section"] if display_config else CONFIG["sensor_section"]
+        cache = cls._CACHES[display_config]
+        config_section = cls._SECTION[display_config]
         with cls._lock, cache["file_lock"]:
-            config = cls._get_config(display_config=display_config)
+            config = cls._get_config_locked(display_config=display_config)
             if not config.has_section(config_section):
                 config.add_section(config_section)
             for key, value in key_value.items():
                 config[config_section][key] = value
+            # render to memory first: ConfigParser.write makes many small writes,
+            # this way the tmp file gets one buffer and one fsync
+            buffer = StringIO()
+            config.write(buffer)
+            # write-to-temp + atomic rename: a crash mid-write can't truncate the INI
             config_path = Path(cache["config_file"])
-            with config_path.open("w", encoding="utf-8") as file:
-                config.write(file)
+            tmp_path = config_path.with_name(config_path.name + ".tmp")
+            with tmp_path.open("w", encoding="utf-8") as file:
+                file.write(buffer.getvalue())
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, config_path)
+            dir_fd = os.open(config_path.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
             cache["st_mtime"] = config_path.stat().st_mtime
+            cache["snapshot"] = cls._snapshot(config)
+            # the writer just produced this generation, so readers can trust the
+            # cache for a full TTL; external edits are still caught by the ≥1s stat
+            cache["last_check"] = time.monotonic()